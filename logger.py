@@ -1,7 +1,176 @@
-import os, datetime, inspect, traceback
+import os, sys, time, atexit, platform, queue, threading, datetime, traceback
 from typing import Literal
-from functools import wraps
-from yaml import load, Loader, dump, Dumper
+from yaml import load
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+try:
+    import liburing
+except ImportError:
+    liburing = None
+try:
+    from logger_core import mount_log_message
+except ImportError:
+    def mount_log_message(log_message_prefix: bytes, message: bytes, new_line: bytes) -> bytes:
+        """
+        Mounts the log message: prefix, message and the new line.
+        Pure Python version of logger_core.mount_log_message, used when the extension isn't built.
+
+        Args:
+            log_message_prefix (bytes): Header, timestamp, caller and level of the message
+            message (bytes): The encoded message
+            new_line (bytes): The encoded new line
+
+        Returns:
+            bytes: The log message
+        """
+        return b''.join((log_message_prefix, message, new_line))
+
+SETTINGS_FILE: str = './log_settings.yml'
+_SETTINGS_CACHE: dict = {}
+FILE_OPEN_FLAGS: int = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, 'O_CLOEXEC', 0) | getattr(os, 'O_BINARY', 0)
+
+
+class FileSink:
+    """
+    File sink that keeps the log file descriptor open in append mode.
+    The messages are kept in a bytearray and written with a single os.write
+    when BUFFER_SIZE bytes are pending or when flush is called.
+    """
+
+    BUFFER_SIZE: int = 64 * 1024
+
+    def __init__(self, file_directory: str):
+        """
+        Opens the file in append mode.
+
+        Args:
+            self (object): Itself
+            file_directory (str): Path to the log file
+        """
+        self.__fd = os.open(file_directory, FILE_OPEN_FLAGS, 0o644)
+        self.__buffer = bytearray()
+
+    def write(self, data: bytes) -> int:
+        self.__buffer += data
+        if len(self.__buffer) >= FileSink.BUFFER_SIZE:
+            self.flush()
+        return len(data)
+
+    def flush(self) -> None:
+        written = 0
+        try:
+            with memoryview(self.__buffer) as pending:
+                while written < len(pending):
+                    written += os.write(self.__fd, pending[written:])
+        finally:
+            # On a failed write the pending bytes are dropped, so a broken file can't grow the buffer forever.
+            self.__buffer.clear()
+
+    def fileno(self) -> int:
+        return self.__fd
+
+    def close(self) -> None:
+        self.flush()
+        os.close(self.__fd)
+
+
+class IoUringSink:
+    """
+    File sink that writes the log messages through io_uring (Linux only, needs the liburing package
+    with the io_uring / io_uring_cqes API, checked by is_available).
+    The messages are kept in a bytearray, like FileSink, and written with a single io_uring
+    write when BUFFER_SIZE bytes are pending or when flush is called.
+    It's only used from the Log writer thread, which already batches the messages,
+    so only one write is in flight and each one costs a single submit-and-wait call, the same
+    count of syscalls of os.write. That's why it's opt-in (io_uring setting) and not the default.
+    It has the same write, flush, fileno and close methods of FileSink.
+    """
+
+    QUEUE_ENTRIES: int = 1
+    BUFFER_SIZE: int = FileSink.BUFFER_SIZE
+    REQUIRED_FUNCTIONS: tuple = ('io_uring', 'io_uring_cqes', 'io_uring_queue_init', 'io_uring_queue_exit', 'io_uring_get_sqe',
+                                 'io_uring_prep_write', 'io_uring_submit_and_wait', 'io_uring_wait_cqe', 'io_uring_cqe_seen')
+
+    @staticmethod
+    def is_available() -> bool:
+        """
+        Checks if the sink can be used: Linux, and an installed liburing with the API used here.
+        Newer liburing releases replaced this API (Ring / Cqe), so importing the package isn't enough.
+
+        Returns:
+            bool: True when the sink can be created
+        """
+        return (liburing is not None and platform.system() == 'Linux'
+                and all(hasattr(liburing, function_name) for function_name in IoUringSink.REQUIRED_FUNCTIONS))
+
+    def __init__(self, file_directory: str):
+        """
+        Opens the file in append mode and creates the io_uring ring.
+
+        Args:
+            self (object): Itself
+            file_directory (str): Path to the log file
+        """
+        self.__fd = os.open(file_directory, FILE_OPEN_FLAGS, 0o644)
+        try:
+            self.__ring = liburing.io_uring()
+            self.__cqes = liburing.io_uring_cqes()
+            liburing.io_uring_queue_init(IoUringSink.QUEUE_ENTRIES, self.__ring, 0)
+        except Exception:
+            os.close(self.__fd)
+            raise
+        self.__buffer = bytearray()
+
+    def write(self, data: bytes) -> int:
+        self.__buffer += data
+        if len(self.__buffer) >= IoUringSink.BUFFER_SIZE:
+            self.flush()
+        return len(data)
+
+    def flush(self) -> None:
+        written = 0
+        try:
+            with memoryview(self.__buffer) as pending:
+                while written < len(pending):
+                    written += self.__submit_write(pending[written:])
+        finally:
+            self.__buffer.clear()
+
+    def fileno(self) -> int:
+        return self.__fd
+
+    def close(self) -> None:
+        try:
+            self.flush()
+        finally:
+            liburing.io_uring_queue_exit(self.__ring)
+            os.close(self.__fd)
+
+    def __submit_write(self, data: memoryview) -> int:
+        """
+        Submits one write and waits for it to complete, with a single io_uring_enter call.
+
+        Args:
+            self (object): Itself
+            data (memoryview): The bytes to write
+
+        Raises:
+            OSError: When the write fails
+
+        Returns:
+            int: The number of bytes written, which may be less than len(data)
+        """
+        sqe = liburing.io_uring_get_sqe(self.__ring)
+        liburing.io_uring_prep_write(sqe, self.__fd, data, len(data), -1)
+        liburing.io_uring_submit_and_wait(self.__ring, 1)
+        liburing.io_uring_wait_cqe(self.__ring, self.__cqes)
+        result = self.__cqes[0].res
+        liburing.io_uring_cqe_seen(self.__ring, self.__cqes[0])
+        if result < 0:
+            raise OSError(-result, os.strerror(-result))
+        return result
 
 
 class Log:
@@ -12,8 +181,25 @@ class Log:
     WARN: int = 3
     ERROR: int = 4
     CRITICAL: int = 5
+    _LEVEL_MAP: dict = {'DEBUG': DEBUG, 'INFO': INFO, 'WARN': WARN, 'ERROR': ERROR, 'CRITICAL': CRITICAL}
+    _LEVEL_PREFIX: dict = {DEBUG: ' [DEBUG] --- ', INFO: ' [INFO] --- ', WARN: ' [WARN] --- ', ERROR: ' [ERROR] --- ', CRITICAL: ' [CRITICAL] --- '}
+    _HEADER: str = '| '
+    _FILE_SEPARATOR: str = ' --- File: '
+    _NEW_LINE: str = '\n'
+    BATCH_MAX: int = 256
+    FLUSH_WAIT_SECONDS: float = 0.1
+    CALLER_CACHE_SIZE: int = 1024
+    TRACEBACK_CACHE_SIZE: int = 256
+    TRACEBACK_LIMIT: int = 8
+    TIMESTAMP_FORMAT: str = '%d/%m/%Y - %H:%M:%S'
+    APPEND_OPENING_METHODS: tuple = ('a', 'a+', 'ab', 'a+b', 'ab+')
+    __slots__ = ('directory', 'opening_method', 'encoding_method', 'level', '_file_name', '_size_limit', '_io_uring',
+                 '_flush_interval_ms', '_flush_every_n', '_pending_writes', '_last_sync', '_queue', '_drain_thread', '_writer_error', '_closed',
+                 '_sink', '_opened_file_directory', '_bytes_written', '_caller_cache', '_traceback_cache', '_cache_lock',
+                 '_cached_date_ordinal', '_cached_file_name', '_cached_file_directory', '_timestamp_cache',
+                 '_encoded_level_prefix', '_encoded_header', '_encoded_file_separator', '_encoded_new_line')
     
-    def __init__(self, *, directory: str, file_name: str, opening_method: str = 'a+', encoding_method: str = 'utf-8', logger_level = 1, size_limit = 512):
+    def __init__(self, *, directory: str, file_name: str, opening_method: str = 'a+', encoding_method: str = 'utf-8', logger_level = 1, size_limit = 512, io_uring: bool = False, flush_interval_ms: int = 50, flush_every_n: int = 1000):
         """
         Constructor method, it's not meant to be called directly.
         As a singleton class, it's necessary to call the get_logger method.
@@ -24,31 +210,51 @@ class Log:
             directory (str): Directory that the logger file is meant to be placed 
             file_name (str): The name that the logger file is meant to be named
             opening_method (str, optional): The opening method of the logger file. Defaults to 'a+'.
+                The file is always written in binary append mode, so only append methods (APPEND_OPENING_METHODS) are accepted.
             encoding_method (str, optional): The encoding written method, the file will be written using this method as basis. Defaults to 'utf-8'.
+                Encodings that add a byte order mark, like 'utf-16', aren't accepted, use 'utf-16-le' or 'utf-16-be'.
             level (int, optional): Debug Level. Defaults to 0.
             size_limit (int, optional): Maximum size for the archive in MegaBytes. Defaults to 512.
+            io_uring (bool, optional): Writes the log file through io_uring instead of FileSink, when IoUringSink.is_available(). Defaults to False.
+            flush_interval_ms (int, optional): Interval in milliseconds between the syncs of the log file to the disk. Defaults to 50.
+            flush_every_n (int, optional): Number of messages that forces a sync of the log file before the interval. Defaults to 1000.
         """
-        if not os.path.exists(directory):
-            os.mkdir(directory)
-        self.__directory = directory
-        self.__file_name = file_name
-        self.__opening_method = opening_method
-        self.__encoding_method = encoding_method
-        self.__level = logger_level
-        self.__size_limit = size_limit
-
-    @property
-    def directory(self) -> str:
-        """
-        Returns the directory where the log is located.
-
-        Args:
-            self (object): Itself
-
-        Returns:
-            str: directory where it's located
-        """
-        return self.__directory
+        if opening_method not in Log.APPEND_OPENING_METHODS:
+            raise ValueError(f"The opening method {opening_method!r} isn't supported, the log file is always opened in append mode, "
+                             f"use one of {Log.APPEND_OPENING_METHODS}")
+        if 'ab'.encode(encoding_method) != 'a'.encode(encoding_method) + 'b'.encode(encoding_method):
+            raise ValueError(f"The encoding {encoding_method} can't encode the message parts separately (it adds a byte order mark), "
+                             "use one with a fixed byte order, like 'utf-16-le'")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self._file_name = file_name
+        self.opening_method = opening_method
+        self.encoding_method = encoding_method
+        self.level = logger_level
+        self._size_limit = size_limit
+        self._io_uring = io_uring
+        self._flush_interval_ms = flush_interval_ms
+        self._flush_every_n = flush_every_n
+        self._pending_writes = 0
+        self._last_sync = time.monotonic()
+        self._queue = queue.SimpleQueue()
+        self._writer_error = None
+        self._closed = False
+        self._caller_cache = {}
+        self._cache_lock = threading.Lock()
+        self._traceback_cache = {}
+        self._cached_date_ordinal = -1
+        self._cached_file_name = None
+        self._cached_file_directory = None
+        self._timestamp_cache = (None, b'')
+        self._encoded_level_prefix = {level: level_prefix.encode(encoding_method) for level, level_prefix in Log._LEVEL_PREFIX.items()}
+        self._encoded_header = Log._HEADER.encode(encoding_method)
+        self._encoded_file_separator = Log._FILE_SEPARATOR.encode(encoding_method)
+        self._encoded_new_line = Log._NEW_LINE.encode(encoding_method)
+        self.__open_file()
+        self._drain_thread = threading.Thread(target=self.__drain, daemon=True)
+        self._drain_thread.start()
+        atexit.register(self.flush)
 
     @property
     def file_directory(self) -> str:
@@ -61,7 +267,8 @@ class Log:
         Returns:
             str: path to the log file
         """
-        return os.path.join(self.__directory, self.file_name)
+        self.__update_file_name_if_day_changed()
+        return self._cached_file_directory
 
     @property
     def file_name(self) -> str:
@@ -78,45 +285,25 @@ class Log:
         Returns:
             str: File name
         """
-        return '{current_date}_{received_name}.log'.format( current_date=datetime.datetime.now().strftime("%Y-%m-%d"),
-                                                                        received_name=self.__file_name)
-    
-    @property
-    def opening_method(self) -> str:
-        """
-        Returns the opening method of the log file, in case it's needed.
+        self.__update_file_name_if_day_changed()
+        return self._cached_file_name
 
-        Args:
-            self (object): Itself
-
-        Returns:
-            str: Opening Method
+    def __update_file_name_if_day_changed(self) -> None:
         """
-        return self.__opening_method
+        Formats the file name and path only once a day, when the current date changes.
 
-    @property
-    def encoding_method(self) -> str:
-        """
-        Returns the encoding method of the log file, in case it's needed.
-        Examples: utf-8, ascii, iso-8859-1
-        
         Args:
             self (object): Itself
-
-        Returns:
-            str: The encoding method
         """
-        return self.__encoding_method
-
-    @property
-    def level(self) -> int:
-        return self.__level
-
+        today = datetime.date.today().toordinal()
+        if today != self._cached_date_ordinal:
+            self._cached_file_name = f'{datetime.date.fromordinal(today).isoformat()}_{self._file_name}.log'
+            self._cached_file_directory = os.path.join(self.directory, self._cached_file_name)
+            self._cached_date_ordinal = today
+    
     @property
     def file_size(self) -> int:
-        if os.path.exists(self.file_directory):
-            return os.stat(self.file_directory).st_size / (1024 * 1024)
-        return 0
+        return self._bytes_written / (1024 * 1024)
     
     def __str__(self) -> str:
         """
@@ -128,13 +315,15 @@ class Log:
         Returns:
             str: Informations about current instance of the object. 
         """
-        file_size = os.stat(self.file_directory).st_size / (1024 * 1024)
-        return f'Directory:{self.__directory}|File:{self.__file_name}|Opening Method:{self.__opening_method}|Encoding Method:{self.__encoding_method}|File Weight (MB):{file_size}'
+        return f'Directory:{self.directory}|File:{self._file_name}|Opening Method:{self.opening_method}|Encoding Method:{self.encoding_method}|File Weight (MB):{self.file_size}'
 
     @property
     def caller_module(self) -> str:
         """
         Get the file name from the archive where the Log was called.
+        The name is cached by the code object of the caller, so the frames are only
+        looked up once for each function that logs. The cache is shared by all the threads
+        that log, so changes to it are made under _cache_lock.
 
         Args:
             self (object): Itself
@@ -142,51 +331,276 @@ class Log:
         Returns:
             str: Caller module name
         """
-        caller = inspect.stack()[4]
-        module_caller = inspect.getmodule(caller[0])
-        return f'{module_caller.__name__} : {caller.function}'
+        caller_frame = sys._getframe(3)
+        caller = caller_frame.f_code
+        module_caller = self._caller_cache.get(caller)
+        if module_caller is None:
+            module_caller = f'{caller_frame.f_globals.get("__name__", "?")} : {caller.co_name}'
+            with self._cache_lock:
+                if len(self._caller_cache) >= Log.CALLER_CACHE_SIZE:
+                    del self._caller_cache[next(iter(self._caller_cache))]
+                self._caller_cache[caller] = module_caller
+        return module_caller
+
+    def _log(self, log_level: int, message_to_log: str, exception_occurrence: Exception = None, /) -> None:
+        """
+        Method that writes messages on the log, shared by [info, debug, warn, critical, error].
+        For normal cases of [INFO, DEBUG, WARN] the exception_occurrence can be set on None
+        In cases of [CRITICAL] if occurs an exception, or is raised an exception, you can pass it through exception_occurrence, so an 
+        specific message can be mounted.
+        In cases of [ERROR] You need to pass the exception through exception_occurrence, otherwise the message will be malformed and will only show the message 
+        that was passed, and not the message and exception.
+    
+        You can pass only the exception exception_occurrence if you only want the exception on the log.
+        When the level is lower than the logger level, nothing is mounted or written.
 
-    def write_log(log_message_mounter):
+        Args:
+            Positional arguments.
+            self (object): The Log instance
+            log_level (int): The level of the message
+            message (str): Message that will be written on log file
+            exception_occurrence (Exception, optional): The Exception that occurred on code. Defaults to None.
         """
-        Decorator function for functions: [info, debug, warn, critical, error]
-        
-        Parameters:
-            function_to_execute: Literal['function'] -> The decorated function that's gonna be executed
-            
+        if self.level > log_level:
+            return
+        if self._closed:
+            raise ValueError('I/O operation on closed logger.')
+        messages = self.__get_messages(message_to_log, exception_occurrence)
+        log_message_prefix = b''.join((self._encoded_header, self.__get_timestamp(), self._encoded_file_separator,
+                                       self.caller_module.encode(self.encoding_method), self._encoded_level_prefix[log_level]))
+        for message in messages:
+            self._queue.put(mount_log_message(log_message_prefix, str(message).encode(self.encoding_method), self._encoded_new_line))
+
+    def info(self, message_to_log: str, exception_occurrence: Exception = None, /) -> None:
+        self._log(Log.INFO, message_to_log, exception_occurrence)
+
+    def debug(self, message_to_log: str, exception_occurrence: Exception = None, /) -> None:
+        self._log(Log.DEBUG, message_to_log, exception_occurrence)
+
+    def warn(self, message_to_log: str, exception_occurrence: Exception = None, /) -> None:
+        self._log(Log.WARN, message_to_log, exception_occurrence)
+
+    def critical(self, message_to_log: str, exception_occurrence: Exception = None, /) -> None:
+        self._log(Log.CRITICAL, message_to_log, exception_occurrence)
+
+    def error(self, message_to_log: str, exception_occurrence: Exception = None, /) -> None:
+        self._log(Log.ERROR, message_to_log, exception_occurrence)
+
+    def __get_timestamp(self) -> bytes:
+        """
+        Returns the encoded timestamp of the current time, with microseconds.
+        The date and time part is formatted only once per second and cached,
+        so only the microseconds are formatted on each call.
+
+        Args:
+            self (object): Itself
+
         Returns:
-            writer: Literal['function'] -> The function that's gonna be returned for "execution"
-        """
-        @wraps(log_message_mounter)
-        def writer(self, message_to_log: str, exception_occurrence: Exception = None, /) -> None:
-            """
-            Method that writes messages on the log.
-            For normal cases of [INFO, DEBUG, WARN] the exception_occurrence can be set on None
-            In cases of [CRITICAL] if occurs an exception, or is raised an exception, you can pass it through exception_occurrence, so an 
-            specific message can be mounted.
-            In cases of [ERROR] You need to pass the exception through exception_occurrence, otherwise the message will be malformed and will only show the message 
-            that was passed, and not the message and exception.
-            
-            You can pass only the exception exception_occurrence if you only want the exception on the log.
-
-            Args:
-                Positional arguments.
-                self (object): The Log instance
-                message (str): Message that will be written on log file
-                exception_occurrence (Exception, optional): The Exception that occurred on code. Defaults to None.
-            """
-            self.__split_file_if_necessary()
-            messages = self.__get_messages(message_to_log, exception_occurrence)
-            self.__write_messages_in_file(messages, log_message_mounter)
-        return writer
-        
+            bytes: The encoded timestamp
+        """
+        second, nanoseconds = divmod(time.time_ns(), 1_000_000_000)
+        cached_second, timestamp_prefix = self._timestamp_cache
+        if second != cached_second:
+            timestamp_prefix = f'{time.strftime(Log.TIMESTAMP_FORMAT, time.localtime(second))}.'.encode(self.encoding_method)
+            self._timestamp_cache = (second, timestamp_prefix)
+        return timestamp_prefix + ('%06d' % (nanoseconds // 1000)).encode(self.encoding_method)
+
     def __split_file_if_necessary(self) -> None:
-        if self.file_size >= self.__size_limit:
+        if self._bytes_written >= self._size_limit * 1024 * 1024:
             self.__split_file()
     
     def __split_file(self) -> None:
-        file_splitted_name = f'{self.__file_name}-1'
-        os.rename(self.directory, os.path.join(self.__directory, file_splitted_name))
-    
+        """
+        Closes the full log file, renames it to the first free "<file name>.<number>"
+        and opens a new log file in its place.
+
+        Args:
+            self (object): Itself
+        """
+        self.__sync_file()
+        self.__close_file()
+        split_number = 1
+        while os.path.exists(f'{self._opened_file_directory}.{split_number}'):
+            split_number += 1
+        os.rename(self._opened_file_directory, f'{self._opened_file_directory}.{split_number}')
+        self.__open_file()
+
+    def __open_file(self) -> None:
+        """
+        Opens the current log file once and keeps it open, so each batch of messages costs a
+        buffered write instead of an open + write + close.
+        When io_uring isn't available or the ring can't be created (blocked by seccomp or the
+        kernel.io_uring_disabled sysctl), the logger falls back to FileSink for good.
+        The file size is read here and then tracked in memory as the messages are written.
+
+        Args:
+            self (object): Itself
+        """
+        self._opened_file_directory = self.file_directory
+        self._sink = None
+        if self._io_uring and IoUringSink.is_available():
+            try:
+                self._sink = IoUringSink(self._opened_file_directory)
+            except Exception:
+                self._io_uring = False
+        if self._sink is None:
+            self._sink = FileSink(self._opened_file_directory)
+        self._bytes_written = os.stat(self._opened_file_directory).st_size
+
+    def __close_file(self) -> None:
+        self._sink.flush()
+        self._sink.close()
+
+    def __reopen_file_if_necessary(self) -> None:
+        if self._opened_file_directory != self.file_directory:
+            self.__sync_file()
+            self.__close_file()
+            self.__open_file()
+
+    def flush(self) -> None:
+        """
+        Writes every queued message to the log file and syncs it to the disk.
+        The messages are written by a background thread and synced in groups, every flush_interval_ms
+        or after flush_every_n messages, so call this method when the log file must be up to date.
+
+        Args:
+            self (object): Itself
+
+        Raises:
+            ValueError: When the logger is closed
+        """
+        if self._closed:
+            raise ValueError('I/O operation on closed logger.')
+        flushed = threading.Event()
+        self._queue.put(flushed)
+        while not flushed.wait(Log.FLUSH_WAIT_SECONDS):
+            if not self._drain_thread.is_alive():
+                break
+        self.__raise_writer_error()
+
+    def close(self) -> None:
+        """
+        Writes every queued message, stops the writer thread and closes the log file.
+        If it's the singleton instance, the next get_logger call creates a new logger.
+
+        Args:
+            self (object): Itself
+        """
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.flush)
+        self._queue.put(None)
+        self._drain_thread.join()
+        if Log._instance is self:
+            Log._instance = None
+        self.__raise_writer_error()
+
+    def __raise_writer_error(self) -> None:
+        """
+        Raises the last error of the writer thread, if any, so the callers of flush know
+        that some messages were lost.
+
+        Args:
+            self (object): Itself
+
+        Raises:
+            Exception: The last error of the writer thread
+        """
+        writer_error, self._writer_error = self._writer_error, None
+        if writer_error is not None:
+            raise writer_error
+
+    def __sync_file(self) -> None:
+        self._sink.flush()
+        os.fsync(self._sink.fileno())
+        self._pending_writes = 0
+        self._last_sync = time.monotonic()
+
+    def __drain(self) -> None:
+        """
+        Body of the writer thread, the only place where the log file is written.
+        Waits for the queued messages and writes them in batches of up to BATCH_MAX,
+        syncing the file when the flush interval expires or flush_every_n messages are pending.
+        A None queued by close stops the thread after the messages queued before it are synced.
+
+        Args:
+            self (object): Itself
+        """
+        flush_interval = self._flush_interval_ms / 1000
+        while True:
+            timeout = max(0, self._last_sync + flush_interval - time.monotonic()) if self._pending_writes else None
+            batch = []
+            try:
+                batch.append(self._queue.get(timeout=timeout))
+                while len(batch) < Log.BATCH_MAX:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+            closing = None in batch
+            try:
+                self.__write_batch(batch)
+                if closing or not batch or self._pending_writes >= self._flush_every_n or self._pending_writes and time.monotonic() - self._last_sync >= flush_interval:
+                    self.__sync_file()
+            except Exception as error:
+                self.__handle_writer_error(error)
+                for item in batch:
+                    if isinstance(item, threading.Event):
+                        item.set()
+            if closing:
+                try:
+                    self._sink.close()
+                except OSError as error:
+                    self._writer_error = error
+                return
+
+    def __handle_writer_error(self, error: Exception) -> None:
+        """
+        Keeps the writer thread alive when writing or syncing the log file fails.
+        The error is shown on the standard error output and kept to be raised by flush,
+        the messages of the failed batch are dropped and the log file is reopened.
+
+        Args:
+            self (object): Itself
+            error (Exception): The error raised while writing the log file
+        """
+        self._writer_error = error
+        sys.stderr.write(f'Log writer error: {error!r}\n')
+        sys.stderr.flush()
+        self._pending_writes = 0
+        self._last_sync = time.monotonic()
+        try:
+            if self._sink is not None:
+                self._sink.close()
+        except OSError:
+            pass
+        try:
+            self.__open_file()
+        except OSError as open_error:
+            self._writer_error = open_error
+            sys.stderr.write(f'Log writer error: {open_error!r}\n')
+            sys.stderr.flush()
+
+    def __write_batch(self, batch: list) -> None:
+        """
+        Writes a batch of queued messages with a single write.
+        The batch may contain flush requests, which are answered after the messages queued before them are synced.
+
+        Args:
+            self (object): Itself
+            batch (list): Encoded messages, flush requests (threading.Event) and the close request (None)
+        """
+        log_messages = []
+        for item in batch:
+            if isinstance(item, threading.Event):
+                self.__write_messages_in_file(log_messages)
+                log_messages = []
+                self.__sync_file()
+                item.set()
+            elif item is not None:
+                log_messages.append(item)
+        self.__write_messages_in_file(log_messages)
+
     def __get_messages(self, message_to_log: str, exception_occurrence: Exception = None) -> list:
         values_to_return = []
         if isinstance(message_to_log, Exception) or  exception_occurrence is not None and isinstance(exception_occurrence, Exception):
@@ -195,90 +609,96 @@ class Log:
             values_to_return.append(message_to_log)
         return values_to_return
 
-    def __write_messages_in_file(self, messages: list, log_message_mounter) -> None:
-        for message in messages:
-            log_message, log_level_message = log_message_mounter(self, message)
-            if self.level <= log_level_message:
-                with open(self.file_directory, self.opening_method, encoding=self.__encoding_method) as file:
-                    file.write(log_message)
-            self.__show_message_if_level_equals(log_level_message, log_message)
+    def __write_messages_in_file(self, log_messages: list) -> None:
+        if not log_messages:
+            return
+        self.__reopen_file_if_necessary()
+        self.__split_file_if_necessary()
+        log_message = b''.join(log_messages)
+        self._sink.write(log_message)
+        self._bytes_written += len(log_message)
+        self._pending_writes += len(log_messages)
+        self.__show_message(log_message)
         
-    def __assemble_exception_message(self, message: str, exception_occurrence: Exception) -> str:
+    def __assemble_exception_message(self, message: str, exception_occurrence: Exception) -> list:
         """
-        The factory of message in case of 
+        The factory of message in case of exceptions, one message for each frame of the traceback.
 
         Args:
-            self (object): _description_
-            message (str): _description_
-            exception_occurrence (Exception): _description_
+            self (object): Itself
+            message (str): The message, or the exception when exception_occurrence is None
+            exception_occurrence (Exception): The exception that occurred
 
         Returns:
-            str: _description_
+            list: The messages of the exception
         """
-        values_to_return = []
-        exception_complete_traceback = traceback.TracebackException.from_exception(message if exception_occurrence is None else exception_occurrence)
-        # exception_traceback_stack =  exception_traceback.stack[0]
-        for exception_traceback in exception_complete_traceback.stack:
-            exception_motive, exception_cause, localization_of_exception, exception_line  = exception_complete_traceback._str, exception_traceback.line, exception_traceback.name, exception_traceback.lineno
-            values_to_return.append(f'{"" if exception_occurrence is None else f"{message} ---"} Motive: {exception_motive} | Cause: {exception_cause} | Line: {exception_line} | Localization of Exception: {localization_of_exception} |')
-        return values_to_return
-    
-    @write_log
-    def info(self, message: str) -> str:
-        return f"| {datetime.datetime.now().strftime('%d/%m/%Y - %H:%M:%S.%f')} --- File: {self.caller_module} [INFO] --- {message}\n", Log.INFO
-        
-    @write_log
-    def debug(self, message: str) -> str:
-        return f"| {datetime.datetime.now().strftime('%d/%m/%Y - %H:%M:%S.%f')} --- File: {self.caller_module} [DEBUG] --- {message}\n", Log.DEBUG
+        exception = message if exception_occurrence is None else exception_occurrence
+        message_prefix = "" if exception_occurrence is None else f"{message} ---"
+        exception_motive = str(exception)
+        return [f'{message_prefix} Motive: {exception_motive} | Cause: {exception_cause} | Line: {exception_line} | Localization of Exception: {localization_of_exception} |'
+                for exception_line, localization_of_exception, exception_cause in self.__get_traceback_frames(exception)]
+
+    def __get_traceback_frames(self, exception: Exception) -> tuple:
+        """
+        Returns the line number, function name and source line of the last frames of the exception traceback.
+        The frames are cached by the code and line of each traceback entry, so the source lines are
+        only read once for each place where an exception is raised. Changes to the cache are made under _cache_lock.
 
-    @write_log
-    def warn(self, message: str) -> str:
-        return f"| {datetime.datetime.now().strftime('%d/%m/%Y - %H:%M:%S.%f')} --- File: {self.caller_module} [WARN] --- {message}\n", Log.WARN
+        Args:
+            self (object): Itself
+            exception (Exception): The exception that occurred
+
+        Returns:
+            tuple: (line number, function name, source line) for each frame
+        """
+        traceback_key = tuple((frame.f_code, line_number) for frame, line_number in traceback.walk_tb(exception.__traceback__))[-Log.TRACEBACK_LIMIT:]
+        traceback_frames = self._traceback_cache.get(traceback_key)
+        if traceback_frames is None:
+            traceback_frames = tuple((frame.lineno, frame.name, frame.line)
+                                     for frame in traceback.extract_tb(exception.__traceback__, limit=-Log.TRACEBACK_LIMIT))
+            with self._cache_lock:
+                if len(self._traceback_cache) >= Log.TRACEBACK_CACHE_SIZE:
+                    del self._traceback_cache[next(iter(self._traceback_cache))]
+                self._traceback_cache[traceback_key] = traceback_frames
+        return traceback_frames
     
-    @write_log
-    def critical(self, message: str) -> str:
-        return f"| {datetime.datetime.now().strftime('%d/%m/%Y - %H:%M:%S.%f')} --- File: {self.caller_module} [CRITICAL] --- {message}\n", Log.CRITICAL
-            
-    @write_log
-    def error(self, message: str) -> str:
-        return f"| {datetime.datetime.now().strftime('%d/%m/%Y - %H:%M:%S.%f')} --- File: {self.caller_module} [ERROR] --- {message}\n", Log.ERROR
-        
-    def __show_message_if_level_equals(self, level_of_occurrence: int, message: str) -> None:
+    def __show_message(self, message: bytes) -> None:
         """
-        Check if the log message leve is the same as the debug level of the logger.
+        Shows the log message on the standard error output.
+        The encoded message is written straight to the binary buffer when the output uses
+        the same encoding of the log file, otherwise it's decoded first.
 
         Args:
             self (object): The instance of Log Object
-            level_of_occurrence (int): The level of the occurrence message
-            message (str): The Message content
+            message (bytes): The encoded Message content
         """
-        if self.level <= level_of_occurrence:
-            os.system(f'echo "{message}"')
+        stderr = sys.stderr
+        stderr_buffer = getattr(stderr, 'buffer', None)
+        if stderr_buffer is not None and stderr.encoding == self.encoding_method:
+            stderr.flush()
+            stderr_buffer.write(message)
+            stderr_buffer.flush()
+        else:
+            stderr.write(message.decode(self.encoding_method))
+            stderr.flush()
 
     @staticmethod
-    def __get_logger_level(logger_level: int) -> None:
+    def __get_logger_level(logger_level: str) -> int:
         """
         Get the logger level and set it to the Log instance.
         
         Args:
-            logger_level (int): The logger level that's gonna be set on the Log instance
-        """
-        if logger_level in ['DEBUG', 'INFO', 'WARN', 'ERROR', 'CRITICAL']:
-            if logger_level == 'DEBUG':
-                return Log.DEBUG
-            elif logger_level == 'INFO':
-                return Log.INFO
-            elif logger_level == 'WARN':
-                return Log.WARN
-            elif logger_level == 'ERROR':
-                return Log.ERROR
-            elif logger_level == 'CRITICAL':
-                return Log.CRITICAL
-        return None
+            logger_level (str): The logger level name that's gonna be set on the Log instance
+        """
+        return Log._LEVEL_MAP.get(logger_level)
     
     def __get_settings__() -> dict:
-        logger_settings = load(open('./log_settings.yml', 'r').read(), Loader=Loader)
-        return logger_settings.get('directory'), logger_settings.get('file_name'), logger_settings.get('opening_method'), logger_settings.get('encoding_method'), logger_settings.get('log_level'), logger_settings.get('size_limit')
+        logger_settings = _SETTINGS_CACHE.get(SETTINGS_FILE)
+        if logger_settings is None:
+            with open(SETTINGS_FILE, 'rb') as settings_file:
+                logger_settings = load(settings_file, Loader=SafeLoader)
+            _SETTINGS_CACHE[SETTINGS_FILE] = logger_settings
+        return logger_settings.get('directory'), logger_settings.get('file_name'), logger_settings.get('opening_method'), logger_settings.get('encoding_method'), logger_settings.get('log_level'), logger_settings.get('size_limit'), logger_settings.get('flush_interval_ms'), logger_settings.get('flush_every_n'), logger_settings.get('io_uring')
     
     @classmethod
     def get_logger(cls):
@@ -290,7 +710,7 @@ class Log:
             self._instance: Literal['Log instance'] -> The instance of the Log object
         """
         if cls._instance is None:
-            directory, file_name, opening_method, encoding_method, logger_level, size_limit = cls.__get_settings__()
+            directory, file_name, opening_method, encoding_method, logger_level, size_limit, flush_interval_ms, flush_every_n, io_uring = cls.__get_settings__()
             logger_level = Log.__get_logger_level(logger_level)
             cls._instance =  cls( directory = directory
                                     , file_name = file_name
@@ -298,5 +718,8 @@ class Log:
                                     , encoding_method = encoding_method if encoding_method is not None else 'utf-8'
                                     , logger_level = logger_level if logger_level is not None else 1
                                     , size_limit = size_limit if size_limit is not None else 512
+                                    , io_uring = io_uring is True
+                                    , flush_interval_ms = flush_interval_ms if flush_interval_ms is not None else 50
+                                    , flush_every_n = flush_every_n if flush_every_n is not None else 1000
                                     )
         return cls._instance
@@ -0,0 +1,30 @@
+# cython: language_level=3
+"""
+Compiled core of the logger, used by logger.py when it's built.
+Build it with: cythonize -i logger_core.pyx
+"""
+from cpython.bytes cimport PyBytes_FromStringAndSize, PyBytes_AS_STRING, PyBytes_GET_SIZE
+from libc.string cimport memcpy
+
+
+cpdef bytes mount_log_message(bytes log_message_prefix not None, bytes message not None, bytes new_line not None):
+    """
+    Mounts the log message in a single allocation: prefix, message and the new line.
+
+    Args:
+        log_message_prefix (bytes): Header, timestamp, caller and level of the message
+        message (bytes): The encoded message
+        new_line (bytes): The encoded new line
+
+    Returns:
+        bytes: The log message
+    """
+    cdef Py_ssize_t prefix_size = PyBytes_GET_SIZE(log_message_prefix)
+    cdef Py_ssize_t message_size = PyBytes_GET_SIZE(message)
+    cdef Py_ssize_t new_line_size = PyBytes_GET_SIZE(new_line)
+    cdef bytes log_message = PyBytes_FromStringAndSize(NULL, prefix_size + message_size + new_line_size)
+    cdef char *buffer = PyBytes_AS_STRING(log_message)
+    memcpy(buffer, PyBytes_AS_STRING(log_message_prefix), prefix_size)
+    memcpy(buffer + prefix_size, PyBytes_AS_STRING(message), message_size)
+    memcpy(buffer + prefix_size + message_size, PyBytes_AS_STRING(new_line), new_line_size)
+    return log_message